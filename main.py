@@ -1,20 +1,25 @@
+import hashlib
 import io
 import os
-import tempfile
+import shutil
 import zipfile
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, List
 
+import folium
 import geopandas as gpd
 import leafmap.foliumap as leafmap
+import numpy as np
 import pandas as pd
+import shapely
 import streamlit as st
 from geopandas.geodataframe import GeoDataFrame
-from pyproj import Geod
+from pyproj import CRS, Transformer
 from pyproj.exceptions import CRSError
-from shapely.geometry import GeometryCollection, MultiPolygon, Polygon, box
+from shapely.errors import GEOSException
+from shapely.geometry import MultiPolygon, Polygon, box
 from shapely.geometry.base import BaseGeometry
-from shapely.ops import unary_union
-from shapely.validation import make_valid
 
 st.set_page_config(page_title="Field Area Comparator", layout="wide")
 st.title("🗌️ Field Boundary Comparison & Area Calculator")
@@ -24,8 +29,17 @@ DEFAULT_CENTER_LAT = 60.76788
 DEFAULT_CENTER_LON = -87.1633111
 DEFAULT_ZOOM_LEVEL = 10
 MAP_HEIGHT = 800
-
-geod = Geod(ellps="WGS84")
+MAX_PARSE_WORKERS = 8
+MAX_CACHED_UPLOADS = 32  # parsed frames kept across all sessions
+COPY_BUFFER_SIZE = 1 << 20
+PLANAR_EPSG_CODES = (6933, 5070, 3857)  # preferred first
+WGS84_SEMI_MAJOR_M = 6378137.0
+WGS84_ECCENTRICITY = np.sqrt(1 / 298.257223563 * (2 - 1 / 298.257223563))
+# q at the pole; the authalic sphere has the same surface area as the ellipsoid
+AUTHALIC_Q_POLE = 1 + (1 - WGS84_ECCENTRICITY**2) / (2 * WGS84_ECCENTRICITY) * np.log(
+    (1 + WGS84_ECCENTRICITY) / (1 - WGS84_ECCENTRICITY)
+)
+AUTHALIC_RADIUS_M = WGS84_SEMI_MAJOR_M * np.sqrt(AUTHALIC_Q_POLE / 2)
 
 COLOR_PALETTE = [
     "#007BFF",
@@ -41,108 +55,253 @@ COLOR_PALETTE = [
 ]
 
 
-def extract_zip(zip_bytes: bytes) -> str:
-    tmpdir = tempfile.mkdtemp()
+# Streamlit re-executes this module on every rerun; keep PROJ setup out of it
+@st.cache_resource
+def get_planar_epsg() -> int | None:
+    for epsg in PLANAR_EPSG_CODES:
+        try:
+            CRS.from_epsg(epsg)
+        except CRSError:
+            continue
+
+        return epsg
+
+    return None
+
+
+@st.cache_resource
+def get_planar_transformer(source_crs: str) -> Transformer | None:
+    epsg = get_planar_epsg()
+    if epsg is None:
+        return None
+
+    return Transformer.from_crs(source_crs, epsg, always_xy=True)
+
+
+@st.cache_resource
+def get_wgs84_transformer(source_crs: str) -> Transformer:
+    return Transformer.from_crs(source_crs, 4326, always_xy=True)
+
+
+def read_ogr(source, **kwargs) -> gpd.GeoDataFrame:
+    # pyogrio reads whole OGR layers at once; Arrow skips per-column conversion
+    return gpd.read_file(source, engine="pyogrio", use_arrow=True, **kwargs)
+
+
+def find_zip_member(z: zipfile.ZipFile, suffix: str) -> str:
+    member = next((name for name in z.namelist() if name.endswith(suffix)), None)
+    if member is None:
+        raise ValueError(f"No {suffix} file found in archive.")
+
+    return member
+
+
+def read_zipped_shapefile(zip_bytes: bytes) -> gpd.GeoDataFrame:
+    buffer = io.BytesIO()
+
     with zipfile.ZipFile(io.BytesIO(zip_bytes)) as z:
-        z.extractall(tmpdir)
-    return tmpdir
+        stem = os.path.splitext(find_zip_member(z, ".shp"))[0]
+
+        # Repack the .shp and its sidecars (.shx, .dbf, .prj, ...) at the root
+        # of an in-memory archive, which GDAL opens via /vsizip//vsimem/
+        with zipfile.ZipFile(buffer, "w") as out:
+            for name in z.namelist():
+                if os.path.splitext(name)[0] != stem:
+                    continue
+
+                with z.open(name) as src, out.open(os.path.basename(name), "w") as dst:
+                    shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
+    buffer.seek(0)
+    return read_ogr(buffer)
+
+
+def read_kmz(kmz_bytes: bytes) -> gpd.GeoDataFrame:
+    with zipfile.ZipFile(io.BytesIO(kmz_bytes)) as z:
+        kml_bytes = z.read(find_zip_member(z, ".kml"))
+
+    return read_ogr(io.BytesIO(kml_bytes), driver="KML")
+
+
+VECTOR_READERS = {
+    ".zip": lambda file: read_zipped_shapefile(file.read()),
+    ".kml": lambda file: read_ogr(file, driver="KML"),
+    ".kmz": lambda file: read_kmz(file.read()),
+    ".geojson": read_ogr,
+    ".json": read_ogr,
+}
 
 
 def read_vector_file(file: io.BytesIO, filename: str) -> gpd.GeoDataFrame:
     ext = os.path.splitext(filename)[1].lower()
 
-    if ext == ".zip":
-        tmpdir = extract_zip(file.read())
-        for f in os.listdir(tmpdir):
-            if f.endswith(".shp"):
-                return gpd.read_file(os.path.join(tmpdir, f))
+    reader = VECTOR_READERS.get(ext)
+    if reader is None:
+        raise ValueError("Unsupported file format.")
 
-    elif ext == ".kmz":
-        with zipfile.ZipFile(file, "r") as zf:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                zf.extractall(tmpdir)
-                for name in zf.namelist():
-                    if name.endswith(".kml"):
-                        return gpd.read_file(os.path.join(tmpdir, name), driver="KML")
+    return reader(file)
 
-    elif ext == ".kml":
-        return gpd.read_file(file, driver="KML")
 
-    elif ext in [".geojson", ".json"]:
-        return gpd.read_file(file)
+def sum_ring_areas(geoms, edge_terms: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+    geoms = np.asarray(geoms, dtype=object)
+    parts, part_idx = shapely.get_parts(geoms, return_index=True)
+    rings, ring_part_idx = shapely.get_rings(parts, return_index=True)
+    coords, coord_ring_idx = shapely.get_coordinates(rings, return_index=True)
 
-    raise ValueError("Unsupported file format.")
+    edges = edge_terms(coords)
+    edges[coord_ring_idx[1:] != coord_ring_idx[:-1]] = 0  # don't bridge rings
 
+    ring_sums = np.bincount(coord_ring_idx[:-1], weights=edges, minlength=len(rings))
+    ring_areas = np.abs(ring_sums)
+
+    # First ring of each polygon is the exterior, the rest are holes
+    is_exterior = np.diff(ring_part_idx, prepend=-1) != 0
+    ring_areas = np.where(is_exterior, ring_areas, -ring_areas)
+
+    return np.bincount(
+        part_idx[ring_part_idx], weights=ring_areas, minlength=len(geoms)
+    ).astype(float)
 
-def geodetic_area(geometry: BaseGeometry) -> float:
-    if isinstance(geometry, Polygon):
-        area, _ = geod.geometry_area_perimeter(geometry)
-        return abs(area)
-    elif isinstance(geometry, MultiPolygon):
-        return sum(
-            abs(geod.geometry_area_perimeter(poly)[0]) for poly in geometry.geoms
-        )
 
-    return 0
+def get_sin_authalic_lat(lat: np.ndarray) -> np.ndarray:
+    e_sin = WGS84_ECCENTRICITY * np.sin(np.deg2rad(lat))
+    q = (1 - WGS84_ECCENTRICITY**2) * (
+        e_sin / WGS84_ECCENTRICITY / (1 - e_sin**2)
+        - np.log((1 - e_sin) / (1 + e_sin)) / (2 * WGS84_ECCENTRICITY)
+    )
+    return q / AUTHALIC_Q_POLE
+
+
+def spherical_excess_edges(
+    coords: np.ndarray, transformer: Transformer | None = None
+) -> np.ndarray:
+    lon, lat = coords[:, 0], coords[:, 1]
+    if transformer is not None:
+        lon, lat = transformer.transform(lon, lat)
+
+    # Chamberlain & Duquette (Turf's area, unscaled) on the authalic sphere,
+    # which keeps areas equal to the WGS84 ellipsoid's
+    lon = np.deg2rad(lon)
+    sin_lat = get_sin_authalic_lat(lat)
+    edges = lon[1:] - lon[:-1]
+    edges *= 2 + sin_lat[:-1] + sin_lat[1:]
+    return edges
+
+
+def planar_edges(coords: np.ndarray, transformer: Transformer) -> np.ndarray:
+    x, y = transformer.transform(coords[:, 0], coords[:, 1])
+    # Trapezoid form of the shoelace sum (doubled); stays precise at large eastings
+    edges = x[1:] - x[:-1]
+    edges *= y[1:] + y[:-1]
+    return edges
+
+
+# Constant factors are applied once per geometry instead of once per edge
+def geodetic_area_vec(geoms, source_crs: str | None = None) -> np.ndarray:
+    transformer = None if source_crs is None else get_wgs84_transformer(source_crs)
+    edge_terms = partial(spherical_excess_edges, transformer=transformer)
+    return sum_ring_areas(geoms, edge_terms) * (AUTHALIC_RADIUS_M**2 / 2)
+
+
+def projected_area_vec(geoms, source_crs: str) -> np.ndarray:
+    transformer = get_planar_transformer(source_crs)
+    return sum_ring_areas(geoms, partial(planar_edges, transformer=transformer)) / 2
+
+
+def explode_geometries(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    # Same result as explode(index_parts=False, ignore_index=True) without
+    # building and dropping a MultiIndex or copying the old geometry column
+    parts, part_idx = shapely.get_parts(gdf.geometry.to_numpy(), return_index=True)
+    attributes = gdf.drop(columns=gdf.geometry.name).take(part_idx)
+    return gpd.GeoDataFrame(
+        attributes.reset_index(drop=True),
+        geometry=gpd.GeoSeries(parts, crs=gdf.crs, name=gdf.geometry.name),
+    )
 
 
 def clean_geometries(gdf: gpd.GeoDataFrame) -> gpd.GeoSeries:
-    return gpd.GeoSeries(
-        gdf.geometry.apply(lambda geom: make_valid(geom).buffer(0)), crs=gdf.crs
+    # "structure" keeps polygonal input polygonal, so only the rest (points,
+    # lines, mixed collections) still needs buffer(0) to reduce it to its
+    # polygonal parts, or an empty polygon
+    geoms = shapely.make_valid(
+        gdf.geometry.to_numpy(), method="structure", keep_collapsed=False
+    )
+    is_other = ~np.isin(
+        shapely.get_type_id(geoms),
+        [shapely.GeometryType.POLYGON, shapely.GeometryType.MULTIPOLYGON, -1],
     )
+    geoms[is_other] = shapely.buffer(geoms[is_other], 0)
+    return gpd.GeoSeries(geoms, crs=gdf.crs, index=gdf.index)
 
 
-def extract_holes(geometry: BaseGeometry) -> List[Polygon]:
-    holes = []
+def extract_holes_vec(geoms) -> np.ndarray:
+    geoms = np.asarray(geoms, dtype=object)
+    polygons, geom_idx = shapely.get_parts(geoms, return_index=True)
+    rings, poly_idx = shapely.get_rings(polygons, return_index=True)
 
-    if isinstance(geometry, Polygon):
-        holes.extend(Polygon(interior) for interior in geometry.interiors)
-    elif isinstance(geometry, MultiPolygon):
-        for poly in geometry.geoms:
-            holes.extend(Polygon(interior) for interior in poly.interiors)
+    # Every ring after a polygon's first (exterior) ring is a hole
+    is_interior = np.diff(poly_idx, prepend=-1) == 0
+
+    # One MultiPolygon of holes per geometry, None where it has none
+    holes = np.empty(len(geoms), dtype=object)
+    if is_interior.any():
+        shapely.multipolygons(
+            shapely.polygons(rings[is_interior]),
+            indices=geom_idx[poly_idx[is_interior]],
+            out=holes,
+        )
 
     return holes
 
 
-def count_parts(geometry: BaseGeometry) -> int:
-    if isinstance(geometry, Polygon):
-        return 1
-    elif isinstance(geometry, MultiPolygon):
-        return len([g for g in geometry.geoms if isinstance(g, (Polygon))])
-    elif isinstance(geometry, GeometryCollection):
-        return len(
-            [g for g in geometry.geoms if isinstance(g, (Polygon, MultiPolygon))]
-        )
+def flatten_parts(geoms) -> tuple[np.ndarray, np.ndarray]:
+    parts, part_idx = shapely.get_parts(geoms, return_index=True)
+
+    # Collections may nest, keep splitting until only simple geometries remain
+    while (shapely.get_type_id(parts) >= shapely.GeometryType.MULTIPOINT).any():
+        parts, sub_idx = shapely.get_parts(parts, return_index=True)
+        part_idx = part_idx[sub_idx]
+
+    return parts, part_idx
+
 
-    return 0
+def count_parts_vec(geoms) -> np.ndarray:
+    geoms = np.asarray(geoms, dtype=object)
+    parts, part_idx = shapely.get_parts(geoms, return_index=True)
+    is_polygonal = np.isin(
+        shapely.get_type_id(parts),
+        [shapely.GeometryType.POLYGON, shapely.GeometryType.MULTIPOLYGON],
+    )
+
+    return np.bincount(part_idx[is_polygonal], minlength=len(geoms))
 
 
-def count_holes(geometry: BaseGeometry) -> int:
-    if isinstance(geometry, Polygon):
-        return len(geometry.interiors)
-    elif isinstance(geometry, MultiPolygon):
-        return sum(len(poly.interiors) for poly in geometry.geoms)
-    elif isinstance(geometry, GeometryCollection):
-        return sum(count_holes(geom) for geom in geometry.geoms)
+def count_holes_vec(geoms) -> np.ndarray:
+    geoms = np.asarray(geoms, dtype=object)
+    parts, part_idx = flatten_parts(geoms)
+    holes = shapely.get_num_interior_rings(parts)
 
-    return 0
+    return np.bincount(part_idx, weights=holes, minlength=len(geoms)).astype(int)
 
 
-def get_poly_type(geometry: BaseGeometry) -> str:
-    if isinstance(geometry, Polygon):
-        return "polygon"
-    elif isinstance(geometry, MultiPolygon):
-        return "multipolygon"
-    elif isinstance(geometry, GeometryCollection):
-        return "geom collection"
+def get_poly_type_vec(geoms) -> np.ndarray:
+    type_ids = shapely.get_type_id(np.asarray(geoms, dtype=object))
 
-    return "unknown"
+    return np.select(
+        [
+            type_ids == shapely.GeometryType.POLYGON,
+            type_ids == shapely.GeometryType.MULTIPOLYGON,
+            type_ids == shapely.GeometryType.GEOMETRYCOLLECTION,
+        ],
+        ["polygon", "multipolygon", "geom collection"],
+        default="unknown",
+    )
 
 
 def upload_files_ui():
     return st.file_uploader(
         "Upload 1 or 2 field boundary files (ZIP, KML, KMZ, GeoJSON)",
-        type=["zip", "kml", "kmz", "geojson", "json"],
+        type=[ext.lstrip(".") for ext in VECTOR_READERS],
         accept_multiple_files=True,
     )
 
@@ -161,56 +320,114 @@ def boundary_color_controls(uploaded_files):
     return file_colors
 
 
-def get_gdf_projection(gdf: gpd.GeoDataFrame) -> GeoDataFrame | None:
-    gdf_proj = None
+# Shared, not copied: callers must take a shallow copy before adding columns
+@st.cache_resource(show_spinner=False, max_entries=MAX_CACHED_UPLOADS)
+def load_gdf(data: bytes, filename: str) -> gpd.GeoDataFrame:
+    gdf = read_vector_file(io.BytesIO(data), filename)
 
-    try:
-        gdf_proj = gdf.to_crs(epsg=6933)
-    except CRSError:
-        try:
-            gdf_proj = gdf.to_crs(epsg=5070)
-            st.warning("EPSG:6933 not available. Using EPSG:5070.")
-        except CRSError:
-            st.warning("EPSG:5070 also unavailable. Falling back to EPSG:3857.")
+    # Splitting copies the whole frame, so only pay for it with Multi*/collections
+    type_ids = shapely.get_type_id(gdf.geometry.to_numpy())
+    if (type_ids >= shapely.GeometryType.MULTIPOINT).any():
+        gdf = explode_geometries(gdf)
+    else:
+        # Exploding would also have dropped rows without geometry
+        missing = gdf.geometry.isna()
+        if missing.any():
+            gdf = gdf[~missing].reset_index(drop=True)
 
-            try:
-                gdf_proj = gdf.to_crs(epsg=3857)
-            except CRSError:
-                st.error(
-                    "Failed to reproject to EPSG:3857. Cannot calculate planar area."
-                )
+    gdf["geometry"] = clean_geometries(gdf)
+    gdf["poly_type"] = get_poly_type_vec(gdf.geometry)
+    gdf["parts"] = count_parts_vec(gdf.geometry)
+    gdf["holes"] = count_holes_vec(gdf.geometry)
+    # Geometry is fixed from here on, so build the hole layer once per upload
+    gdf["hole_geoms"] = extract_holes_vec(gdf.geometry)
+
+    return gdf
+
+
+@st.cache_data(show_spinner=False)
+def compute_areas(data: bytes, filename: str, use_spherical: bool) -> np.ndarray:
+    gdf = load_gdf(data, filename)
+
+    if use_spherical:
+        # Spherical excess needs lon/lat; a missing CRS is taken as EPSG:4326
+        if gdf.crs is None or gdf.crs.is_geographic:
+            return geodetic_area_vec(gdf.geometry)
 
-    return gdf_proj
+        return geodetic_area_vec(gdf.geometry, gdf.crs.srs)
+
+    if gdf.crs is None:
+        raise ValueError("File has no CRS. Cannot calculate planar area.")
+
+    return projected_area_vec(gdf.geometry, gdf.crs.srs)
+
+
+def measure_upload(
+    data: bytes, filename: str, use_spherical: bool
+) -> tuple[gpd.GeoDataFrame, np.ndarray]:
+    return load_gdf(data, filename), compute_areas(data, filename, use_spherical)
+
+
+def get_upload_key(file, file_idx):
+    digest = hashlib.blake2b(file.getvalue(), digest_size=16).digest()
+    return (file.name, digest, file_idx)
 
 
 def process_uploaded_files(uploaded_files, use_spherical, file_colors):
     gdfs = []
     color_legend = []
 
-    for file_idx, file in enumerate(uploaded_files):
-        try:
-            gdf = read_vector_file(file, file.name)
-            gdf = gdf.explode(index_parts=False, ignore_index=True)
-            gdf["source"] = file.name
-            gdf["geometry"] = clean_geometries(gdf)
-
-            if use_spherical:
-                gdf["area_m2"] = gdf.geometry.apply(geodetic_area)
-            else:
-                gdf_proj = get_gdf_projection(gdf)
-                if gdf_proj is None:
-                    continue
+    if not use_spherical:
+        epsg = get_planar_epsg()
+        if epsg is None:
+            st.error("No planar CRS available. Cannot calculate planar area.")
+            return gdfs, color_legend
+
+        if epsg != PLANAR_EPSG_CODES[0]:
+            st.warning(f"EPSG:{PLANAR_EPSG_CODES[0]} not available. Using EPSG:{epsg}.")
+
+    # Finished frames live in session state so unchanged uploads skip the
+    # cache_data hashing and copying on every widget interaction
+    gdf_cache = st.session_state.get("gdf_cache", {})
+    upload_keys = [
+        get_upload_key(file, file_idx) for file_idx, file in enumerate(uploaded_files)
+    ]
+    keys = [(upload_key, use_spherical) for upload_key in upload_keys]
+    misses = [file_idx for file_idx, key in enumerate(keys) if key not in gdf_cache]
+
+    # Parse and measure uploads concurrently (GDAL and GEOS release the GIL);
+    # everything that touches the page stays on the script thread below
+    futures = {}
+    if misses:
+        max_workers = min(MAX_PARSE_WORKERS, len(misses))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                file_idx: executor.submit(
+                    measure_upload,
+                    uploaded_files[file_idx].getvalue(),
+                    uploaded_files[file_idx].name,
+                    use_spherical,
+                )
+                for file_idx in misses
+            }
 
-                gdf["area_m2"] = gdf_proj.area
+    fresh_cache = {}
+    for file_idx, (file, key) in enumerate(zip(uploaded_files, keys)):
+        try:
+            gdf = gdf_cache.get(key)
+            if gdf is None:
+                gdf, area_m2 = futures[file_idx].result()
+                gdf = gdf.copy(deep=False)
+                gdf["source"] = file.name
+                # Kept at full precision; tables and totals round for display
+                gdf["area_acres"] = area_m2 * ACRES_PER_SQ_METER
+                gdf["area_m2"] = area_m2
+                gdf["poly_id"] = f"{file_idx+1}-" + pd.Series(
+                    np.arange(1, len(gdf) + 1), index=gdf.index
+                ).astype(str)
+            fresh_cache[key] = gdf
 
-            gdf["area_acres"] = gdf["area_m2"] * ACRES_PER_SQ_METER
-            gdf["area_m2"] = gdf["area_m2"].round(2)
-            gdf["area_acres"] = gdf["area_acres"].round(2)
-            gdf["poly_id"] = [f"{file_idx+1}-{i+1}" for i in range(len(gdf))]
             gdf["enabled"] = True
-            gdf["poly_type"] = gdf.geometry.apply(get_poly_type)
-            gdf["parts"] = gdf.geometry.apply(count_parts)
-            gdf["holes"] = gdf.geometry.apply(count_holes)
 
             color = file_colors[file.name]
             gdf["color"] = color
@@ -220,6 +437,12 @@ def process_uploaded_files(uploaded_files, use_spherical, file_colors):
         except Exception as e:
             st.error(f"❌ Failed to load {file.name}: {e}")
 
+    # Keep both area methods of the current uploads so toggling back is a
+    # lookup; drop frames for uploads that were removed or replaced
+    st.session_state["gdf_cache"] = {
+        key: gdf for key, gdf in gdf_cache.items() if key[0] in upload_keys
+    } | fresh_cache
+
     return gdfs, color_legend
 
 
@@ -235,6 +458,23 @@ def display_layer_controls(gdfs: List[GeoDataFrame]):
     return layer_visibility
 
 
+def get_hover_frame(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    # Hover shows the file's own attributes; keep internal columns out
+    hover = gdf.drop(columns=["color", "enabled", "hole_geoms"])
+    # Areas are kept at full precision; show them the way the tables do
+    hover[["area_acres", "area_m2"]] = hover[["area_acres", "area_m2"]].round(2)
+
+    # leafmap only stringifies datetime64[ns] columns, but pyogrio reads
+    # datetimes as [ms] and dates/times as Python objects
+    for col in hover.columns.drop(hover.geometry.name):
+        if pd.api.types.is_datetime64_any_dtype(hover[col]) or (
+            pd.api.types.infer_dtype(hover[col]) in ("date", "time", "datetime")
+        ):
+            hover[col] = hover[col].astype(str)
+
+    return hover
+
+
 def add_layer_for_gdf(
     gdf,
     layer_visibility,
@@ -251,38 +491,46 @@ def add_layer_for_gdf(
     if not layer_visibility.get(source_name, True):
         return
 
-    for _, row in gdf.iterrows():
-        if not row["enabled"]:
-            continue
+    visible = gdf[gdf["enabled"]]
+    if visible.empty:
+        return
 
-        highlight = row["poly_id"] == selected_poly_id
-        gdf_row = gpd.GeoDataFrame([row], crs=gdf.crs)
+    color = file_colors[source_name]
 
-        m.add_gdf(
-            gdf_row,
-            layer_name=f"{row['poly_id']} ({source_name})",
-            style={
-                "fillOpacity": 0.9 if highlight else 0.4,
-                "weight": 4 if highlight else 1,
-                "color": ("lightgreen" if highlight else file_colors[source_name]),
-                "fillColor": file_colors[source_name],
-            },
-            info_mode="on_hover",
-        )
+    def style_function(feature):
+        highlight = feature["properties"]["poly_id"] == selected_poly_id
+        return {
+            "fillOpacity": 0.9 if highlight else 0.4,
+            "weight": 4 if highlight else 1,
+            "color": ("lightgreen" if highlight else color),
+            "fillColor": color,
+        }
 
-        if not show_holes:
-            continue
+    m.add_gdf(
+        get_hover_frame(visible),
+        layer_name=source_name,
+        zoom_to_layer=False,
+        style_function=style_function,
+        info_mode="on_hover",
+    )
 
-        for hole in extract_holes(row.geometry):
-            m.add_gdf(
-                gpd.GeoDataFrame(geometry=[hole], crs=gdf.crs),
-                layer_name="hole",
-                style={
-                    "color": hole_color,
-                    "fillColor": hole_color,
-                    "fillOpacity": 1,
-                },
-            )
+    if not show_holes:
+        return
+
+    holes = shapely.get_parts(visible["hole_geoms"].to_numpy())
+    if len(holes) == 0:
+        return
+
+    m.add_gdf(
+        gpd.GeoDataFrame(geometry=holes, crs=gdf.crs),
+        layer_name=f"holes ({source_name})",
+        zoom_to_layer=False,
+        style={
+            "color": hole_color,
+            "fillColor": hole_color,
+            "fillOpacity": 1,
+        },
+    )
 
 
 def add_layers(
@@ -326,17 +574,13 @@ def display_area_table(
         }
     )
 
+    poly_id_to_pos = {pid: i for i, pid in enumerate(gdf["poly_id"].to_numpy())}
+    selected_poly_id = st.session_state.get(f"{source_name}_clicked_poly_id")
+
     st.selectbox(
         f"Select a polygon to highlight from {source_name}",
         options=gdf["poly_id"],
-        index=(
-            0
-            if st.session_state.get(f"{source_name}_clicked_poly_id")
-            not in gdf["poly_id"].values
-            else gdf["poly_id"]
-            .tolist()
-            .index(st.session_state[f"{source_name}_clicked_poly_id"])
-        ),
+        index=poly_id_to_pos.get(selected_poly_id, 0),
         key=f"selectbox_{source_name}",  # 👈 unique key
         on_change=make_selectbox_callback(source_name),
     )
@@ -354,9 +598,7 @@ def display_area_table(
         },
     )
 
-    for idx, row in gdf.iterrows():
-        pid = row["poly_id"]
-        gdf.at[idx, "enabled"] = edited_df.loc[pid]["Visible"]
+    gdf["enabled"] = gdf["poly_id"].map(edited_df["Visible"]).to_numpy()
 
     visible_df = edited_df[edited_df["Visible"]]
     total_area = visible_df[label].sum()
@@ -371,20 +613,23 @@ def display_area_table(
 def display_comparison_table(gdfs, use_acres):
     label = "Acres" if use_acres else "m²"
 
-    raw_col_1 = gdfs[0]["area_acres" if use_acres else "area_m2"]
-    raw_col_2 = gdfs[1]["area_acres" if use_acres else "area_m2"]
+    area_col = "area_acres" if use_acres else "area_m2"
+    raw_col_1 = gdfs[0][area_col].to_numpy()
+    raw_col_2 = gdfs[1][area_col].to_numpy()
 
     # Pad shorter column with NaNs
-    max_len = max(len(raw_col_1), len(raw_col_2))
-    raw_col_1 = raw_col_1.reindex(range(max_len)).reset_index(drop=True)
-    raw_col_2 = raw_col_2.reindex(range(max_len)).reset_index(drop=True)
+    max_len = max(raw_col_1.size, raw_col_2.size)
+    padded_1 = np.full(max_len, np.nan)
+    padded_1[: raw_col_1.size] = raw_col_1
+    padded_2 = np.full(max_len, np.nan)
+    padded_2[: raw_col_2.size] = raw_col_2
 
-    missing_1 = raw_col_1.isna()
-    missing_2 = raw_col_2.isna()
+    missing_1 = np.isnan(padded_1)
+    missing_2 = np.isnan(padded_2)
 
-    col_1 = raw_col_1.fillna(0)
-    col_2 = raw_col_2.fillna(0)
-    diff = (col_1 - col_2).round(2)
+    col_1 = np.nan_to_num(padded_1)
+    col_2 = np.nan_to_num(padded_2)
+    diff = col_1 - col_2
 
     st.subheader("🔄 Side-by-side Comparison (highlights missing areas in yellow)")
     comp_df = pd.DataFrame(
@@ -395,15 +640,10 @@ def display_comparison_table(gdfs, use_acres):
         }
     )
 
-    def highlight_missing(row_idx):
-        style_row = []
-        style_row.append("background-color: #fff3cd" if missing_1.iloc[row_idx] else "")
-        style_row.append("background-color: #fff3cd" if missing_2.iloc[row_idx] else "")
-        style_row.append("")  # No style for diff
-        return style_row
-
+    # No style for diff
+    missing = np.column_stack([missing_1, missing_2, np.zeros(max_len, dtype=bool)])
     style_mask = pd.DataFrame(
-        [highlight_missing(i) for i in range(len(comp_df))],
+        np.where(missing, "background-color: #fff3cd", ""),
         columns=comp_df.columns,
     )
 
@@ -416,26 +656,73 @@ def display_comparison_table(gdfs, use_acres):
     st.markdown(f"**Total diff: {round(diff.sum(), 2)} {label}**")
 
 
-def display_boundary_difference(gdfs, m):
+def union_geometries(geoms) -> BaseGeometry:
+    geoms = np.asarray(geoms, dtype=object)
+
+    # Coverage union skips overlap tests but is only defined for edge-matched,
+    # non-overlapping input; anything else comes back invalid or raises
     try:
-        st.subheader("📌 Boundary Difference")
+        union = shapely.coverage_union_all(geoms)
+        if union.is_valid:
+            return union
+    except GEOSException:
+        pass
 
-        poly1 = unary_union(gdfs[0].geometry.apply(lambda g: make_valid(g).buffer(0)))
-        poly2 = unary_union(gdfs[1].geometry.apply(lambda g: make_valid(g).buffer(0)))
+    return shapely.union_all(geoms)
+
+
+def get_extents_overlap(geoms_1, geoms_2) -> bool:
+    if geoms_1.size == 0 or geoms_2.size == 0:
+        return False
+
+    minx_1, miny_1, maxx_1, maxy_1 = shapely.total_bounds(geoms_1)
+    minx_2, miny_2, maxx_2, maxy_2 = shapely.total_bounds(geoms_2)
+    # NaN bounds (all geometries empty) compare False, i.e. no overlap
+    return bool(
+        minx_1 <= maxx_2 and minx_2 <= maxx_1 and miny_1 <= maxy_2 and miny_2 <= maxy_1
+    )
 
-        poly1 = make_valid(poly1).buffer(0)
-        poly2 = make_valid(poly2).buffer(0)
 
-        only_in_1 = poly1.difference(poly2)
-        only_in_2 = poly2.difference(poly1)
+def get_symmetric_difference(geoms_1, geoms_2) -> tuple[BaseGeometry, BaseGeometry]:
+    geoms_1 = np.asarray(geoms_1, dtype=object)
+    geoms_2 = np.asarray(geoms_2, dtype=object)
+    union_1 = union_geometries(geoms_1)
+    union_2 = union_geometries(geoms_2)
+
+    # Files that cannot overlap are each their own difference
+    if not get_extents_overlap(geoms_1, geoms_2):
+        return union_1, union_2
+
+    return shapely.difference(union_1, union_2), shapely.difference(union_2, union_1)
+
+
+def display_boundary_difference(gdfs, m):
+    try:
+        st.subheader("📌 Boundary Difference")
+
+        only_in_1, only_in_2 = get_symmetric_difference(
+            gdfs[0].geometry.to_numpy(), gdfs[1].geometry.to_numpy()
+        )
 
         def safe_add_diff(geometry, crs, label, color):
-            if not geometry.is_empty and isinstance(geometry, (Polygon, MultiPolygon)):
-                m.add_gdf(
-                    gpd.GeoDataFrame(geometry=[geometry], crs=crs),
-                    layer_name=label,
-                    style={"color": color, "weight": 4, "fillOpacity": 0.4},
-                )
+            if geometry.is_empty or not isinstance(geometry, (Polygon, MultiPolygon)):
+                return
+
+            if crs is not None and crs.to_epsg() != 4326:
+                geometry = gpd.GeoSeries([geometry], crs=crs).to_crs(4326).iloc[0]
+
+            # Hand folium GEOS-serialized GeoJSON instead of __geo_interface__
+            # tuples, which it would round-trip through json in Python
+            folium.GeoJson(
+                shapely.to_geojson(geometry),
+                name=label,
+                style_function=lambda _: {
+                    "color": color,
+                    "weight": 4,
+                    "fillOpacity": 0.4,
+                },
+                highlight_function=lambda _: {"weight": 6, "fillOpacity": 0},
+            ).add_to(m)
 
         safe_add_diff(only_in_1, gdfs[0].crs, "Only in 1st", "red")
         safe_add_diff(only_in_2, gdfs[1].crs, "Only in 2nd", "blue")
@@ -445,19 +732,44 @@ def display_boundary_difference(gdfs, m):
         st.warning(f"⚠️ Could not compute boundary difference: {e}")
 
 
-def set_map_bounds(m, gdfs):
-    map_bounds = []
-    for gdf in gdfs:
-        map_bounds.extend(gdf.total_bounds.reshape(2, 2).tolist())
+def get_wgs84_bounds(gdf) -> np.ndarray:
+    bounds = gdf.total_bounds
+    # The map works in lon/lat; leafmap also treats a missing CRS as EPSG:4326
+    if gdf.crs is None:
+        return bounds
+
+    return np.array(get_wgs84_transformer(gdf.crs.srs).transform_bounds(*bounds))
 
+
+def get_total_bounds(gdfs):
+    map_bounds = [get_wgs84_bounds(gdf) for gdf in gdfs if not gdf.empty]
+    # Uploads whose geometries all cleaned away to empty have NaN bounds
+    map_bounds = [bounds for bounds in map_bounds if np.isfinite(bounds).all()]
     if not map_bounds:
+        return None
+
+    all_bounds = np.stack(map_bounds)
+    minx, miny = all_bounds[:, :2].min(axis=0).tolist()
+    maxx, maxy = all_bounds[:, 2:].max(axis=0).tolist()
+
+    return minx, miny, maxx, maxy
+
+
+def get_map_center(bounds):
+    if bounds is None:
+        return [DEFAULT_CENTER_LAT, DEFAULT_CENTER_LON]
+
+    minx, miny, maxx, maxy = bounds
+
+    return [(miny + maxy) / 2, (minx + maxx) / 2]
+
+
+def set_map_bounds(m, bounds):
+    if bounds is None:
         return
 
     try:
-        minx = min(x[0] for x in map_bounds)
-        miny = min(x[1] for x in map_bounds)
-        maxx = max(x[0] for x in map_bounds)
-        maxy = max(x[1] for x in map_bounds)
+        minx, miny, maxx, maxy = bounds
 
         # TODO: doesn't work for some KML files - investigate
         m.fit_bounds([[miny, minx], [maxy, maxx]])
@@ -467,6 +779,7 @@ def set_map_bounds(m, gdfs):
         m.add_gdf(
             bbox_gdf,
             layer_name="Bounding Box",
+            zoom_to_layer=False,
             style={"color": "red", "fillOpacity": 0},
         )
     except Exception as e:
@@ -492,12 +805,13 @@ def render_ui():
         uploaded_files, use_spherical, file_colors
     )
 
+    bounds = get_total_bounds(gdfs)
     m = leafmap.Map(
-        center=[DEFAULT_CENTER_LAT, DEFAULT_CENTER_LON],
+        center=get_map_center(bounds),
         zoom=DEFAULT_ZOOM_LEVEL,
         height=MAP_HEIGHT,
     )
-    set_map_bounds(m, gdfs)
+    set_map_bounds(m, bounds)
 
     unit = "area_acres" if use_acres else "area_m2"
     label = "Acres" if use_acres else "m²"